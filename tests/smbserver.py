@@ -24,14 +24,21 @@
 from __future__ import (absolute_import, division, print_function)
 # unicode_literals)
 import argparse
+import collections
 import os
+import struct
 import sys
 import logging
 import tempfile
+import threading
 try: # Python 3
     import configparser
 except ImportError: # Python 2
     import ConfigParser as configparser
+try: # Python 3
+    import queue
+except ImportError: # Python 2
+    import Queue as queue
 
 # Import our curl test data helper
 import curl_test_data
@@ -47,8 +54,65 @@ from impacket.nt_errors import (STATUS_ACCESS_DENIED, STATUS_SUCCESS,
 log = logging.getLogger(__name__)
 SERVER_MAGIC = "SERVER_MAGIC"
 TESTS_MAGIC = "TESTS_MAGIC"
+MAGIC_PATHS = frozenset((SERVER_MAGIC, TESTS_MAGIC))
 VERIFIED_REQ = "verifiedserver"
-VERIFIED_RSP = b"WE ROOLZ: {pid}\n"
+VERIFIED_RSP = b"WE ROOLZ: %d\n"
+
+# Where possible keep temporary files in memory rather than on disk.
+SHM_DIR = "/dev/shm"
+TEMP_DIR = SHM_DIR if os.path.isdir(SHM_DIR) else None
+
+# Open files can be referred to through here, where it exists.
+PROC_FD_DIR = "/proc/self/fd"
+HAVE_PROC_FD = os.path.isdir(PROC_FD_DIR)
+
+# The number of idle connection handling threads to keep around for reuse.
+MAX_IDLE_WORKERS = 4
+
+# The number of closed test files to keep around for reuse.
+MAX_POOLED_FILES = 8
+
+# The RootFid and Disposition fields of the NT_CREATE_ANDX request parameters
+# (see impacket's SMBNtCreateAndX_Parameters), which are the only ones we need.
+NT_CREATE_ANDX_PARMS = struct.Struct("<11xI20xI")
+
+# The mini config for the server, as (section, ((option, value), ...)) pairs.
+SMB_CONFIG = (
+    ("global", (
+        ("server_name", "SERVICE"),
+        ("server_os", "UNIX"),
+        ("server_domain", "WORKGROUP"),
+        ("log_file", ""),
+        ("credentials_file", ""),
+    )),
+    # We need a share which allows us to test that the server is running
+    ("SERVER", (
+        ("comment", "server function"),
+        ("read only", "yes"),
+        ("share type", "0"),
+        ("path", SERVER_MAGIC),
+    )),
+    # Have a share for tests.  These files will be autogenerated from the
+    # test input.
+    ("TESTS", (
+        ("comment", "tests"),
+        ("read only", "yes"),
+        ("share type", "0"),
+        ("path", TESTS_MAGIC),
+    )),
+)
+
+# NT_CREATE_ANDX response fields, and the file information fields they are
+# filled in from.
+CREATE_RESP_INFO_FIELDS = (
+    ("CreateTime", "CreationTime"),
+    ("LastAccessTime", "LastAccessTime"),
+    ("LastWriteTime", "LastWriteTime"),
+    ("LastChangeTime", "LastChangeTime"),
+    ("FileAttributes", "ExtFileAttributes"),
+    ("AllocationSize", "AllocationSize"),
+    ("EndOfFile", "EndOfFile"),
+)
 
 
 def smbserver(options):
@@ -60,29 +124,13 @@ def smbserver(options):
         with open(options.pidfile, "w") as f:
             f.write("{0}".format(pid))
 
-    # Here we write a mini config for the server
-    smb_config = configparser.ConfigParser()
-    smb_config.add_section("global")
-    smb_config.set("global", "server_name", "SERVICE")
-    smb_config.set("global", "server_os", "UNIX")
-    smb_config.set("global", "server_domain", "WORKGROUP")
-    smb_config.set("global", "log_file", "")
-    smb_config.set("global", "credentials_file", "")
-
-    # We need a share which allows us to test that the server is running
-    smb_config.add_section("SERVER")
-    smb_config.set("SERVER", "comment", "server function")
-    smb_config.set("SERVER", "read only", "yes")
-    smb_config.set("SERVER", "share type", "0")
-    smb_config.set("SERVER", "path", SERVER_MAGIC)
-
-    # Have a share for tests.  These files will be autogenerated from the
-    # test input.
-    smb_config.add_section("TESTS")
-    smb_config.set("TESTS", "comment", "tests")
-    smb_config.set("TESTS", "read only", "yes")
-    smb_config.set("TESTS", "share type", "0")
-    smb_config.set("TESTS", "path", TESTS_MAGIC)
+    # Here we write a mini config for the server. Nothing in it needs
+    # interpolating, so a RawConfigParser will do.
+    smb_config = configparser.RawConfigParser()
+    for section, settings in SMB_CONFIG:
+        smb_config.add_section(section)
+        for option, value in settings:
+            smb_config.set(section, option, value)
 
     if not options.srcdir or not os.path.isdir(options.srcdir):
         raise ScriptException("--srcdir is mandatory")
@@ -94,7 +142,10 @@ def smbserver(options):
                                test_data_directory=test_data_dir)
     log.info("[SMB] setting up SMB server on port %s", options.port)
     smb_server.processConfigFile()
-    smb_server.serve_forever()
+    try:
+        smb_server.serve_forever()
+    finally:
+        smb_server.server_close()
     return 0
 
 
@@ -115,32 +166,134 @@ class TestSmbServer(imp_smbserver.SMBSERVER):
         # Set up a test data object so we can get test data later.
         self.ctd = curl_test_data.TestData(test_data_directory)
 
+        # Test data doesn't change while the server is running, so cache the
+        # contents of each test file the first time it is requested.
+        self._test_cache = {}
+
+        # Per-request debug messages are only built if debug logging was
+        # enabled when the server was created.
+        self._log_debug = log.isEnabledFor(logging.DEBUG)
+
+        # The information returned for each magic file is cached in the same
+        # way, as the file contents (and so sizes) never change.
+        self._file_info_cache = {}
+
+        # Temporary files which couldn't be unlinked as soon as they were
+        # created, and so need removing when the server is closed.
+        self._named_temp_files = set()
+        self._named_temp_files_lock = threading.Lock()
+
+        # The response to the "verifiedserver" request never changes, so write
+        # it to a file once and reopen that file for each request. The
+        # descriptor is kept open, as a memfd only exists while it is.
+        self.verified_fid, self.verified_path = self.create_temp_file(
+            VERIFIED_REQ)
+        self.write_to_fid(self.verified_fid, VERIFIED_RSP % os.getpid())
+
+        # Connections are handed to a pool of reusable worker threads rather
+        # than each getting a thread of its own.
+        self._connections = queue.Queue()
+        self._worker_lock = threading.Lock()
+        self._idle_workers = 0
+
+        # Temporary files for closed test files, as (fid, filename) pairs,
+        # which can be reused rather than creating new ones.
+        self._file_pool = collections.deque()
+        self._file_pool_lock = threading.Lock()
+
         # Override smbComNtCreateAndX so we can pretend to have files which
         # don't exist.
         self.hookSmbCommand(imp_smb.SMB.SMB_COM_NT_CREATE_ANDX,
                             self.create_and_x)
 
+        # Override smbComClose so that test files can go back in the pool.
+        self.hookSmbCommand(imp_smb.SMB.SMB_COM_CLOSE, self.close)
+
+        # Override smbComReadAndX so test files can be read from memory.
+        self.hookSmbCommand(imp_smb.SMB.SMB_COM_READ_ANDX, self.read_and_x)
+
+    def server_close(self):
+        """
+        Close the server, closing pooled temporary files and removing any
+        left on disk.
+        """
+        imp_smbserver.SMBSERVER.server_close(self)
+
+        with self._file_pool_lock:
+            while self._file_pool:
+                fid, _ = self._file_pool.popleft()
+                os.close(fid)
+
+        with self._named_temp_files_lock:
+            for filename in self._named_temp_files:
+                try:
+                    os.remove(filename)
+                except OSError:
+                    log.exception("Failed to remove %s", filename)
+            self._named_temp_files.clear()
+
+    def process_request(self, request, client_address):
+        """
+        Hand a new connection to an idle worker thread, only starting a new
+        worker if all of the existing ones are busy.
+        """
+        with self._worker_lock:
+            if self._idle_workers > 0:
+                self._idle_workers -= 1
+            else:
+                worker = threading.Thread(target=self.connection_worker)
+                worker.daemon = True
+                worker.start()
+
+        self._connections.put((request, client_address))
+
+    def connection_worker(self):
+        """
+        Serve connections from the queue until there are enough idle workers
+        without this one.
+        """
+        while True:
+            request, client_address = self._connections.get()
+            self.process_request_thread(request, client_address)
+
+            with self._worker_lock:
+                if self._idle_workers >= MAX_IDLE_WORKERS:
+                    return
+                self._idle_workers += 1
+
     def create_and_x(self, conn_id, smb_server, smb_command, recv_packet):
         """
         Our version of smbComNtCreateAndX looks for special test files and
         fools the rest of the framework into opening them as if they were
         normal files.
         """
+        # This is the server's own dict rather than a copy, so changes to it
+        # don't need storing back with setConnectionData().
         conn_data = smb_server.getConnectionData(conn_id)
 
+        # Only shares with a magic path need any special handling, so pass
+        # anything else straight on to the original handler before parsing
+        # the request. That also deals with invalid TIDs.
+        share = conn_data["ConnectedShares"].get(recv_packet["Tid"])
+        if share is None or share.get("path") not in MAGIC_PATHS:
+            return imp_smbserver.SMBCommands.smbComNtCreateAndX(conn_id,
+                                                                smb_server,
+                                                                smb_command,
+                                                                recv_packet)
+
         # Wrap processing in a try block which allows us to throw SmbException
         # to control the flow.
         try:
-            ncax_parms = imp_smb.SMBNtCreateAndX_Parameters(
+            # Pick out the few parameters we need directly, rather than
+            # having impacket unpack all of them.
+            root_fid, disposition = NT_CREATE_ANDX_PARMS.unpack_from(
                 smb_command["Parameters"])
 
-            path = self.get_share_path(conn_data,
-                                       ncax_parms["RootFid"],
-                                       recv_packet["Tid"])
+            path = self.get_share_path(conn_data, root_fid, share)
             log.info("[SMB] Requested share path: %s", path)
 
-            disposition = ncax_parms["Disposition"]
-            log.debug("[SMB] Requested disposition: %s", disposition)
+            if self._log_debug:
+                log.debug("[SMB] Requested disposition: %s", disposition)
 
             # Currently we only support reading files.
             if disposition != imp_smb.FILE_OPEN:
@@ -149,7 +302,7 @@ class TestSmbServer(imp_smbserver.SMBSERVER):
 
             # Check to see if the path we were given is actually a
             # magic path which needs generating on the fly.
-            if path not in [SERVER_MAGIC, TESTS_MAGIC]:
+            if path not in MAGIC_PATHS:
                 # Pass the command onto the original handler.
                 return imp_smbserver.SMBCommands.smbComNtCreateAndX(conn_id,
                                                                     smb_server,
@@ -163,7 +316,8 @@ class TestSmbServer(imp_smbserver.SMBSERVER):
             requested_file = imp_smbserver.decodeSMBString(
                 flags2,
                 ncax_data["FileName"])
-            log.debug("[SMB] User requested file '%s'", requested_file)
+            if self._log_debug:
+                log.debug("[SMB] User requested file '%s'", requested_file)
 
             if path == SERVER_MAGIC:
                 fid, full_path = self.get_server_path(requested_file)
@@ -174,47 +328,36 @@ class TestSmbServer(imp_smbserver.SMBSERVER):
             resp_parms = imp_smb.SMBNtCreateAndXResponse_Parameters()
             resp_data = ""
 
-            # Simple way to generate a fid
-            if len(conn_data["OpenedFiles"]) == 0:
-                fakefid = 1
-            else:
-                fakefid = conn_data["OpenedFiles"].keys()[-1] + 1
+            # Generate a fid from a per-connection counter, wrapping at the
+            # 16-bit fid limit. Skip any fids which are still open, including
+            # ones the impacket handlers have handed out themselves.
+            opened_files = conn_data["OpenedFiles"]
+            fakefid = conn_data.setdefault("NextFakeFid", 1)
+            while fakefid in opened_files:
+                fakefid = fakefid % 0xFFFF + 1
+            conn_data["NextFakeFid"] = fakefid % 0xFFFF + 1
             resp_parms["Fid"] = fakefid
             resp_parms["CreateAction"] = disposition
 
-            if os.path.isdir(path):
-                resp_parms[
-                    "FileAttributes"] = imp_smb.SMB_FILE_ATTRIBUTE_DIRECTORY
-                resp_parms["IsDirectory"] = 1
-            else:
-                resp_parms["IsDirectory"] = 0
-                resp_parms["FileAttributes"] = ncax_parms["FileAttributes"]
+            # Magic files are never directories. Their attributes come from
+            # the file information below.
+            resp_parms["IsDirectory"] = 0
 
-            # Get this file's information
-            resp_info, error_code = imp_smbserver.queryPathInformation(
-                "", full_path, level=imp_smb.SMB_QUERY_FILE_ALL_INFO)
-
-            if error_code != STATUS_SUCCESS:
-                raise SmbException(error_code, "Failed to query path info")
-
-            resp_parms["CreateTime"] = resp_info["CreationTime"]
-            resp_parms["LastAccessTime"] = resp_info[
-                "LastAccessTime"]
-            resp_parms["LastWriteTime"] = resp_info["LastWriteTime"]
-            resp_parms["LastChangeTime"] = resp_info[
-                "LastChangeTime"]
-            resp_parms["FileAttributes"] = resp_info[
-                "ExtFileAttributes"]
-            resp_parms["AllocationSize"] = resp_info[
-                "AllocationSize"]
-            resp_parms["EndOfFile"] = resp_info["EndOfFile"]
+            # Copy this file's information into the response in one go,
+            # rather than through a __setitem__ call per field.
+            resp_parms.fields.update(
+                self.get_file_info(path, requested_file, full_path))
+            error_code = STATUS_SUCCESS
 
             # Let's store the fid for the connection
             # smbServer.log("Create file %s, mode:0x%x" % (pathName, mode))
-            conn_data["OpenedFiles"][fakefid] = {}
-            conn_data["OpenedFiles"][fakefid]["FileHandle"] = fid
-            conn_data["OpenedFiles"][fakefid]["FileName"] = path
-            conn_data["OpenedFiles"][fakefid]["DeleteOnClose"] = False
+            opened_file = {"FileHandle": fid,
+                           "FileName": path,
+                           "DeleteOnClose": False}
+            if path == TESTS_MAGIC:
+                opened_file["TempFileName"] = full_path
+                opened_file["Contents"] = self._test_cache[requested_file]
+            opened_files[fakefid] = opened_file
 
         except SmbException as s:
             log.debug("[SMB] SmbException hit: %s", s)
@@ -225,53 +368,193 @@ class TestSmbServer(imp_smbserver.SMBSERVER):
         resp_cmd = imp_smb.SMBCommand(imp_smb.SMB.SMB_COM_NT_CREATE_ANDX)
         resp_cmd["Parameters"] = resp_parms
         resp_cmd["Data"] = resp_data
-        smb_server.setConnectionData(conn_id, conn_data)
 
         return [resp_cmd], None, error_code
 
-    def get_share_path(self, conn_data, root_fid, tid):
-        conn_shares = conn_data["ConnectedShares"]
-
-        if tid in conn_shares:
-            if root_fid > 0:
-                # If we have a rootFid, the path is relative to that fid
-                path = conn_data["OpenedFiles"][root_fid]["FileName"]
-                log.debug("RootFid present %s!" % path)
+    def close(self, conn_id, smb_server, smb_command, recv_packet):
+        """
+        Our version of smbComClose puts the temporary files behind test files
+        back in the pool, and otherwise leaves the original handler to do the
+        work.
+        """
+        conn_data = smb_server.getConnectionData(conn_id)
+        close_parms = imp_smb.SMBClose_Parameters(smb_command["Parameters"])
+        opened_file = conn_data["OpenedFiles"].get(close_parms["FID"])
+
+        if opened_file is not None and "TempFileName" in opened_file:
+            temp_file = (opened_file["FileHandle"],
+                         opened_file["TempFileName"])
+            if self.release_temp_file(temp_file):
+                # Stop the original handler from closing the pooled file.
+                opened_file["FileHandle"] = imp_smbserver.VOID_FILE_DESCRIPTOR
             else:
-                if "path" in conn_shares[tid]:
-                    path = conn_shares[tid]["path"]
-                else:
-                    raise SmbException(STATUS_ACCESS_DENIED,
-                                       "Connection share had no path")
+                # The original handler closes it, but we have to remove it.
+                self.remove_temp_file(opened_file["TempFileName"])
+
+        return imp_smbserver.SMBCommands.smbComClose(conn_id,
+                                                     smb_server,
+                                                     smb_command,
+                                                     recv_packet)
+
+    def read_and_x(self, conn_id, smb_server, smb_command, recv_packet):
+        """
+        Our version of smbComReadAndX serves reads of test files straight
+        from the cached test data, rather than seeking and reading the
+        temporary file. Everything else goes to the original handler.
+        """
+        conn_data = smb_server.getConnectionData(conn_id)
+
+        if smb_command["WordCount"] == 0x0A:
+            read_parms = imp_smb.SMBReadAndX_Parameters2(
+                smb_command["Parameters"])
+        else:
+            read_parms = imp_smb.SMBReadAndX_Parameters(
+                smb_command["Parameters"])
+
+        opened_file = conn_data["OpenedFiles"].get(read_parms["Fid"])
+        if opened_file is None or "Contents" not in opened_file:
+            return imp_smbserver.SMBCommands.smbComReadAndX(conn_id,
+                                                            smb_server,
+                                                            smb_command,
+                                                            recv_packet)
+
+        offset = read_parms["Offset"]
+        if "HighOffset" in read_parms.fields:
+            offset += read_parms["HighOffset"] << 32
+        resp_data = opened_file["Contents"][offset:
+                                            offset + read_parms["MaxCount"]]
+
+        resp_parms = imp_smb.SMBReadAndXResponse_Parameters()
+        resp_parms["Remaining"] = 0xffff
+        resp_parms["DataCount"] = len(resp_data)
+        resp_parms["DataOffset"] = 59
+        resp_parms["DataCount_Hi"] = 0
+
+        resp_cmd = imp_smb.SMBCommand(imp_smb.SMB.SMB_COM_READ_ANDX)
+        resp_cmd["Parameters"] = resp_parms
+        resp_cmd["Data"] = resp_data
+
+        return [resp_cmd], None, STATUS_SUCCESS
+
+    def get_share_path(self, conn_data, root_fid, share):
+        """
+        Get the path a request is relative to. The share has already been
+        looked up from the TID (and checked to have a path) by the caller.
+        """
+        if root_fid > 0:
+            # If we have a rootFid, the path is relative to that fid
+            path = conn_data["OpenedFiles"][root_fid]["FileName"]
+            log.debug("RootFid present %s!", path)
         else:
-            raise SmbException(imp_smbserver.STATUS_SMB_BAD_TID,
-                               "TID was invalid")
+            path = share["path"]
 
         return path
 
+    def get_file_info(self, path, requested_filename, full_path):
+        """
+        Get the NT_CREATE_ANDX response fields describing a magic file, as a
+        tuple of (field, value) pairs. The result is cached per requested
+        file so repeat opens don't need to stat the file again.
+        """
+        key = (path, requested_filename)
+        file_info = self._file_info_cache.get(key)
+
+        if file_info is None:
+            resp_info, error_code = imp_smbserver.queryPathInformation(
+                "", full_path, level=imp_smb.SMB_QUERY_FILE_ALL_INFO)
+
+            if error_code != STATUS_SUCCESS:
+                raise SmbException(error_code, "Failed to query path info")
+
+            file_info = tuple((parm, resp_info[info])
+                              for parm, info in CREATE_RESP_INFO_FIELDS)
+            self._file_info_cache[key] = file_info
+
+        return file_info
+
     def get_server_path(self, requested_filename):
-        log.debug("[SMB] Get server path '%s'", requested_filename)
+        if self._log_debug:
+            log.debug("[SMB] Get server path '%s'", requested_filename)
 
-        if requested_filename not in [VERIFIED_REQ]:
+        if requested_filename != VERIFIED_REQ:
             raise SmbException(STATUS_NO_SUCH_FILE, "Couldn't find the file")
 
-        fid, filename = tempfile.mkstemp()
-        log.debug("[SMB] Created %s (%d) for storing '%s'",
-                  filename, fid, requested_filename)
+        if self._log_debug:
+            log.debug("[SMB] Verifying server is alive")
 
-        contents = ""
+        # Open a new descriptor each time so that concurrent readers don't
+        # share a file offset.
+        fid = os.open(self.verified_path, os.O_RDONLY)
+        return fid, self.verified_path
 
-        if requested_filename == VERIFIED_REQ:
-            log.debug("[SMB] Verifying server is alive")
-            contents = VERIFIED_RSP.format(pid=os.getpid())
+    def create_temp_file(self, name):
+        """
+        Create a memory backed temporary file, returning its file descriptor
+        and a path which refers to it. Uses memfd_create where available,
+        falling back to a temporary file in /dev/shm.
+        """
+        if hasattr(os, "memfd_create"):
+            fid = os.memfd_create(name, os.MFD_CLOEXEC)
+            return fid, "{0}/{1}".format(PROC_FD_DIR, fid)
+
+        fid, filename = tempfile.mkstemp(dir=TEMP_DIR)
 
-        self.write_to_fid(fid, contents)
+        if HAVE_PROC_FD:
+            # Unlink the file straight away so it goes when its descriptor is
+            # closed, and refer to it through the descriptor instead.
+            os.unlink(filename)
+            return fid, "{0}/{1}".format(PROC_FD_DIR, fid)
+
+        with self._named_temp_files_lock:
+            self._named_temp_files.add(filename)
         return fid, filename
 
+    def get_temp_file(self, name):
+        """
+        Get an empty temporary file, reusing one from the pool if possible.
+        """
+        with self._file_pool_lock:
+            temp_file = self._file_pool.popleft() if self._file_pool else None
+
+        if temp_file is None:
+            return self.create_temp_file(name)
+
+        fid, _ = temp_file
+        os.ftruncate(fid, 0)
+        os.lseek(fid, 0, os.SEEK_SET)
+        return temp_file
+
+    def release_temp_file(self, temp_file):
+        """
+        Put a temporary file back in the pool. Returns False if the pool is
+        full, in which case the caller must close the file.
+        """
+        with self._file_pool_lock:
+            if len(self._file_pool) >= MAX_POOLED_FILES:
+                return False
+            self._file_pool.append(temp_file)
+        return True
+
+    def remove_temp_file(self, filename):
+        """
+        Remove a temporary file which isn't going back in the pool, if it
+        still has a name on disk. The caller is responsible for closing it.
+        """
+        with self._named_temp_files_lock:
+            if filename not in self._named_temp_files:
+                return
+            self._named_temp_files.remove(filename)
+
+        os.remove(filename)
+
     def write_to_fid(self, fid, contents):
-        # Write the contents to file descriptor
-        os.write(fid, contents)
-        os.fsync(fid)
+        # Write the contents to file descriptor. There's no need to sync it
+        # to disk, as the file is only ever read back by this process.
+        # os.write() may write less than it was given, so keep going from a
+        # view of the same buffer rather than copying what's left.
+        remaining = memoryview(contents)
+        while remaining:
+            remaining = remaining[os.write(fid, remaining):]
 
         # Rewind the file to the beginning so a read gets us the contents
         os.lseek(fid, 0, os.SEEK_SET)
@@ -279,17 +562,28 @@ class TestSmbServer(imp_smbserver.SMBSERVER):
     def get_test_path(self, requested_filename):
         log.info("[SMB] Get reply data from 'test%s'", requested_filename)
 
-        fid, filename = tempfile.mkstemp()
-        log.debug("[SMB] Created %s (%d) for storing test '%s'",
-                  filename, fid, requested_filename)
+        fid, filename = self.get_temp_file(requested_filename)
+        if self._log_debug:
+            log.debug("[SMB] Using %s (%d) for storing test '%s'",
+                      filename, fid, requested_filename)
 
         try:
-            contents = self.ctd.get_test_data(requested_filename)
+            contents = self._test_cache.get(requested_filename)
+            if contents is None:
+                # The test data is text; encode it once here so the file
+                # gets the same bytes on Python 2 and 3.
+                contents = self.ctd.get_test_data(
+                    requested_filename).encode("utf-8")
+                self._test_cache[requested_filename] = contents
+
             self.write_to_fid(fid, contents)
             return fid, filename
 
         except Exception:
             log.exception("Failed to make test file")
+            if not self.release_temp_file((fid, filename)):
+                os.close(fid)
+                self.remove_temp_file(filename)
             raise SmbException(STATUS_NO_SUCH_FILE, "Failed to make test file")
 
 